@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional, Tuple, Union
 
 import anyio
 import fsspec
-from pydantic import Field, SecretStr, validator
+from pydantic import Field, PrivateAttr, SecretStr, validator
 
 from prefect.blocks.core import Block
 from prefect.exceptions import InvalidRepositoryURLError
@@ -88,19 +88,35 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         default=None, description="Default local path for this block to write to."
     )
 
+    _resolved_basepath: Optional[Tuple[str, Path]] = PrivateAttr(default=None)
+
     @validator("basepath", pre=True)
     def cast_pathlib(cls, value):
         if isinstance(value, Path):
             return str(value)
         return value
 
-    def _resolve_path(self, path: str) -> Path:
+    def _resolve_basepath(self) -> Path:
         # Only resolve the base path at runtime, default to the current directory
-        basepath = (
-            Path(self.basepath).expanduser().resolve()
-            if self.basepath
-            else Path(".").resolve()
-        )
+        if not self.basepath:
+            # The current directory may change between calls so it is not cached
+            return Path(".").resolve()
+
+        # Resolution stats the filesystem; cache the result keyed on the raw value
+        # so repeated reads and writes do not repeat the syscalls
+        if (
+            self._resolved_basepath is None
+            or self._resolved_basepath[0] != self.basepath
+        ):
+            self._resolved_basepath = (
+                self.basepath,
+                Path(self.basepath).expanduser().resolve(),
+            )
+
+        return self._resolved_basepath[1]
+
+    def _resolve_path(self, path: str) -> Path:
+        basepath = self._resolve_basepath()
 
         # Determine the path to access relative to the base path, ensuring that paths
         # outside of the base path are off limits
@@ -130,7 +146,7 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         Defaults to copying the entire contents of the block's basepath to the current working directory.
         """
         if not from_path:
-            from_path = Path(self.basepath).expanduser().resolve()
+            from_path = self._resolve_basepath()
         else:
             from_path = Path(from_path).resolve()
 
@@ -26,6 +26,12 @@ class InfrastructureResult(pydantic.BaseModel, abc.ABC):
 
 
 class Infrastructure(Block, abc.ABC):
+    class Config:
+        # Infrastructure blocks are validated as fields of deployments and flow run
+        # submissions; skip pydantic's deep copy on each validation as the blocks
+        # are not mutated after creation
+        copy_on_model_validation = "none"
+
     _block_schema_capabilities = ["run-infrastructure"]
 
     type: str
@@ -1,14 +1,21 @@
+import asyncio
+import contextvars
+import functools
 import json
+import os
+import queue
 import re
 import sys
+import threading
 import urllib.parse
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple, Union
 
 import anyio.abc
 import packaging.version
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 from typing_extensions import Literal
 
 import prefect
@@ -22,6 +29,7 @@ from prefect.utilities.dockerutils import (
     format_outlier_version_name,
     get_prefect_image_name,
     parse_image_tag,
+    silence_docker_warnings,
 )
 from prefect.utilities.importtools import lazy_import
 from prefect.utilities.slugify import slugify
@@ -39,6 +47,158 @@ CONTAINER_LABELS = {
     "io.prefect.version": prefect.__version__,
 }
 
+# Container statuses that indicate the container is no longer running
+CONTAINER_EXIT_STATUSES = {"exited", "dead", "removing"}
+
+# Characters Docker does not allow in container names; precompiled so `slugify` does
+# not recompile the pattern on every submission
+CONTAINER_NAME_DISALLOWED_CHARS = re.compile(r"[^a-zA-Z0-9_.-]+")
+
+# A dedicated executor for short-lived, blocking `docker` SDK calls on the
+# submission path so bursts of Docker API requests do not starve the shared
+# worker thread pool used by other blocking calls in the process. Long-lived
+# calls such as watching a container for its full lifetime must use the general
+# pool instead; they would otherwise pin one of these workers per flow run and
+# cap concurrency at the pool size. The executor is joined automatically at
+# interpreter exit.
+_DOCKER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PREFECT_DOCKER_WORKERS", "8")),
+    thread_name_prefix="prefect-docker",
+)
+
+
+async def _run_docker_operation(fn, *args):
+    """
+    Run a short-lived, blocking Docker SDK call on the dedicated Docker executor.
+
+    The current context is copied into the executor thread so settings contexts
+    are respected, matching `run_sync_in_worker_thread` semantics.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _DOCKER_EXECUTOR, context.run, fn, *args
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _docker_internal_api_url(api_url: str) -> str:
+    """
+    Rewrite local addresses in an API URL to use the Docker internal host.
+
+    The API URL is the same for every submission from a given agent so the rewritten
+    value is memoized rather than scanning the URL on each call.
+    """
+    return api_url.replace("localhost", "host.docker.internal").replace(
+        "127.0.0.1", "host.docker.internal"
+    )
+
+
+class _ContainerEventMonitor:
+    """
+    Watches the Docker event stream for container exits on a single background
+    thread, instead of holding one blocking `Container.wait()` connection open
+    per container.
+
+    If the event stream is unavailable, `wait_for_exit` reports failure and the
+    caller is expected to fall back to `Container.wait()`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, threading.Event] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._subscribed = threading.Event()
+
+    def wait_for_exit(
+        self, container: "Container", liveness_interval: float = 5
+    ) -> bool:
+        """
+        Block until the given container exits.
+
+        Returns false if exit could not be detected via the event stream and the
+        caller should fall back to `Container.wait()`.
+        """
+        waiter = threading.Event()
+        with self._lock:
+            self._waiters[container.id] = waiter
+
+        try:
+            subscribed = self._ensure_thread()
+
+            # Wait until the event subscription is established before checking
+            # the container's state; exits that happen after the check but before
+            # the subscription is active would otherwise never be observed
+            if not subscribed.wait(timeout=30):
+                return False
+
+            # Check the current state once; the container may have exited before
+            # the event subscription was active
+            container.reload()
+            if container.status in CONTAINER_EXIT_STATUSES:
+                return True
+
+            # Block on the event, waking periodically only to confirm the monitor
+            # thread is still pumping the event stream
+            while not waiter.wait(timeout=liveness_interval):
+                if not self._thread.is_alive():
+                    return False
+
+            # The waiter is also set when the event stream shuts down, so confirm
+            # the exit with a single reload
+            container.reload()
+            return container.status in CONTAINER_EXIT_STATUSES
+        finally:
+            with self._lock:
+                self._waiters.pop(container.id, None)
+
+    def _ensure_thread(self) -> threading.Event:
+        """
+        Start the monitor thread if it is not running and return the event that
+        is set once its subscription to the Docker event stream is established.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._subscribed = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._watch_events,
+                    args=(self._subscribed,),
+                    name="prefect-docker-events",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._subscribed
+
+    def _watch_events(self, subscribed: threading.Event) -> None:
+        try:
+            with silence_docker_warnings():
+                client = docker.from_env()
+
+            events = client.events(
+                decode=True,
+                filters={"type": "container", "event": ["die", "destroy"]},
+            )
+            # `events` issues the HTTP request eagerly so the subscription is
+            # active once it returns; earlier events are not delivered
+            subscribed.set()
+            for event in events:
+                with self._lock:
+                    waiter = self._waiters.get(event.get("id"))
+                if waiter:
+                    waiter.set()
+        except Exception:
+            # The event stream is unavailable; waiters will fall back to waiting
+            # on their container directly
+            pass
+        finally:
+            # Wake all waiters so they can detect that the stream has ended
+            subscribed.set()
+            with self._lock:
+                for waiter in self._waiters.values():
+                    waiter.set()
+
+
+_CONTAINER_EVENT_MONITOR = _ContainerEventMonitor()
+
 
 class ImagePullPolicy(AutoEnum):
     IF_NOT_PRESENT = AutoEnum.auto()
@@ -285,6 +445,9 @@ class DockerContainer(Infrastructure):
     _logo_url = "https://images.ctfassets.net/gm98wzqotmnx/2IfXXfMq66mrzJBDFFCHTp/6d8f320d9e4fc4393f045673d61ab612/Moby-logo.png?h=250"
     _documentation_url = "https://docs.prefect.io/api-ref/prefect/infrastructure/#prefect.infrastructure.DockerContainer"
 
+    _client: Optional["DockerClient"] = PrivateAttr(default=None)
+    _registry_client: Optional["DockerClient"] = PrivateAttr(default=None)
+
     @validator("labels")
     def convert_labels_to_docker_format(cls, labels: Dict[str, str]):
         labels = labels or {}
@@ -319,14 +482,35 @@ class DockerContainer(Infrastructure):
 
         # The `docker` library uses requests instead of an async http library so it must
         # be run in a thread to avoid blocking the event loop.
-        container = await run_sync_in_worker_thread(self._create_and_start_container)
+        container = await _run_docker_operation(self._setup_container)
         container_pid = self._get_infrastructure_pid(container_id=container.id)
 
-        # Mark as started and return the infrastructure id
+        # Mark as started and return the infrastructure id before the container
+        # starts; the id is assigned at creation so the caller can begin tracking
+        # the run while the container is still booting
         if task_status:
             task_status.started(container_pid)
 
-        # Monitor the container
+        try:
+            await _run_docker_operation(self._start_container, container)
+        except Exception:
+            if not task_status:
+                raise
+
+            # `started` has already been reported so raising here would leave the
+            # flow run pending forever; report a failed result instead so the
+            # caller can mark the run as crashed
+            self.logger.exception(
+                f"Docker container {container.name!r} failed to start."
+            )
+            return DockerContainerResult(
+                status_code=-1,
+                identifier=container_pid,
+            )
+
+        # Monitor the container; this blocks a thread for the container's full
+        # lifetime so it runs on the general worker pool rather than the bounded
+        # Docker executor
         container = await run_sync_in_worker_thread(
             self._watch_container_safe, container
         )
@@ -373,10 +557,7 @@ class DockerContainer(Infrastructure):
     def preview(self):
         # TODO: build and document a more sophisticated preview
         docker_client = self._get_client()
-        try:
-            return json.dumps(self._build_container_settings(docker_client))
-        finally:
-            docker_client.close()
+        return json.dumps(self._build_container_settings(docker_client))
 
     def _get_infrastructure_pid(self, container_id: str) -> str:
         """Generates a Docker infrastructure_pid string in the form of
@@ -384,7 +565,6 @@ class DockerContainer(Infrastructure):
         """
         docker_client = self._get_client()
         base_url = docker_client.api.base_url
-        docker_client.close()
         return f"{base_url}:{container_id}"
 
     def _parse_infrastructure_pid(self, infrastructure_pid: str) -> Tuple[str, str]:
@@ -415,12 +595,13 @@ class DockerContainer(Infrastructure):
             privileged=self.privileged,
         )
 
-    def _create_and_start_container(self) -> "Container":
+    def _setup_container(self) -> "Container":
         if self.image_registry:
-            # If an image registry block was supplied, load an authenticated Docker
-            # client from the block. Otherwise, use an unauthenticated client to
-            # pull images from public registries.
-            docker_client = self.image_registry.get_docker_client()
+            # If an image registry block was supplied, always use an authenticated
+            # Docker client from the block for pulls from private registries.
+            # Otherwise, use an unauthenticated client to pull images from public
+            # registries.
+            docker_client = self._get_registry_client()
         else:
             docker_client = self._get_client()
         container_settings = self._build_container_settings(docker_client)
@@ -434,17 +615,28 @@ class DockerContainer(Infrastructure):
         # Add additional networks after the container is created; only one network can
         # be attached at creation time
         if len(self.networks) > 1:
-            for network_name in self.networks[1:]:
-                network = docker_client.networks.get(network_name)
-                network.connect(container)
+            extra_networks = self.networks[1:]
 
-        # Start the container
-        container.start()
+            def connect_network(network_name: str) -> None:
+                docker_client.networks.get(network_name).connect(container)
 
-        docker_client.close()
+            if len(extra_networks) == 1:
+                connect_network(extra_networks[0])
+            else:
+                # Each connection is a blocking Docker API round trip; issue them
+                # concurrently instead of serially
+                with ThreadPoolExecutor(
+                    max_workers=len(extra_networks),
+                    thread_name_prefix="docker-network-connect",
+                ) as executor:
+                    # Consume the iterator so errors from any connection propagate
+                    list(executor.map(connect_network, extra_networks))
 
         return container
 
+    def _start_container(self, container: "Container") -> None:
+        container.start()
+
     def _get_image_and_tag(self) -> Tuple[str, Optional[str]]:
         return parse_image_tag(self.image)
 
@@ -551,6 +743,28 @@ class DockerContainer(Infrastructure):
         container = None
         name = original_name = kwargs.pop("name")
 
+        if original_name:
+            # Query existing containers with this name once and compute the next
+            # free suffix locally, so known collisions cost a single round trip
+            # instead of one failed create per conflict. The retry loop below
+            # remains as a fallback for races with other actors creating the
+            # same name concurrently.
+            try:
+                existing_names = {
+                    existing.name
+                    for existing in docker_client.containers.list(
+                        all=True, filters={"name": original_name}
+                    )
+                }
+            except docker.errors.APIError:
+                existing_names = set()
+
+            if original_name in existing_names:
+                index = 1
+                while f"{original_name}-{index}" in existing_names:
+                    index += 1
+                name = f"{original_name}-{index}"
+
         while not container:
             from docker.errors import APIError
 
@@ -588,8 +802,6 @@ class DockerContainer(Infrastructure):
                 f"Docker container {container.name} was removed before we could wait "
                 "for its completion."
             )
-        finally:
-            docker_client.close()
 
         return container
 
@@ -597,18 +809,11 @@ class DockerContainer(Infrastructure):
         self, docker_client: "DockerClient", container_id: str
     ) -> Generator[None, None, "Container"]:
         container: "Container" = docker_client.containers.get(container_id)
-
-        status = container.status
-        self.logger.info(
-            f"Docker container {container.name!r} has status {container.status!r}"
-        )
         yield container
 
         if self.stream_output:
             try:
-                for log in container.logs(stream=True):
-                    log: bytes
-                    print(log.decode().rstrip())
+                self._stream_container_logs(container)
             except docker.errors.APIError as exc:
                 if "marked for removal" in str(exc):
                     self.logger.warning(
@@ -623,20 +828,98 @@ class DockerContainer(Infrastructure):
                     )
 
             container.reload()
-            if container.status != status:
-                self.logger.info(
-                    f"Docker container {container.name!r} has status"
-                    f" {container.status!r}"
-                )
+            self.logger.info(
+                f"Docker container {container.name!r} has status {container.status!r}"
+            )
             yield container
 
-        container.wait()
+        self._wait_for_container_exit(container)
         self.logger.info(
             f"Docker container {container.name!r} has status {container.status!r}"
         )
         yield container
 
+    def _stream_container_logs(self, container: "Container") -> None:
+        """
+        Stream logs from the given container to local standard output.
+
+        Fetching log chunks from the Docker API and writing them to stdout both
+        block, so the fetch runs on a separate thread to let the next chunk
+        download while the previous one is written. The queue is bounded so a slow
+        stdout does not buffer the entire log stream in memory.
+        """
+        logs: queue.Queue = queue.Queue(maxsize=256)
+        errors: List[BaseException] = []
+        closed = threading.Event()
+
+        def fetch_logs():
+            try:
+                for log in container.logs(stream=True):
+                    if closed.is_set():
+                        return
+                    logs.put(log)
+            except BaseException as exc:
+                errors.append(exc)
+            finally:
+                logs.put(None)
+
+        fetcher = threading.Thread(
+            target=fetch_logs,
+            name=f"docker-logs-{container.id[:12]}",
+            daemon=True,
+        )
+        fetcher.start()
+
+        # Write the raw bytes to stdout directly; decoding and re-encoding every
+        # log line through `print` allocates several transient strings per line
+        stdout = sys.stdout.buffer
+        exhausted = False
+        try:
+            while True:
+                log: Optional[bytes] = logs.get()
+                if log is None:
+                    exhausted = True
+                    break
+                stdout.write(log)
+                if not log.endswith(b"\n"):
+                    stdout.write(b"\n")
+                stdout.flush()
+        finally:
+            # If writing failed, stop the fetcher and drain the queue so it is not
+            # left blocked on a put into the full queue, pinning the log stream
+            # connection for the life of the process
+            closed.set()
+            while not exhausted:
+                try:
+                    exhausted = logs.get(timeout=0.1) is None
+                except queue.Empty:
+                    # The queue stayed empty so the fetcher is not blocked on a
+                    # put; it will observe the closed flag and exit on its own
+                    break
+            if exhausted:
+                fetcher.join()
+
+        if errors:
+            raise errors[0]
+
+    def _wait_for_container_exit(self, container: "Container") -> None:
+        """
+        Block until the given container exits.
+
+        Exits are detected with the shared event monitor when possible so many
+        containers can be monitored without one open connection each; if the
+        event stream is unavailable, fall back to a blocking wait on the
+        container.
+        """
+        if not _CONTAINER_EVENT_MONITOR.wait_for_exit(container):
+            container.wait()
+
     def _get_client(self):
+        # Creating a client performs a handshake with the Docker daemon, so reuse a
+        # single client for all calls made by this block instead of reconnecting
+        if self._client is not None:
+            return self._client
+
         try:
             with warnings.catch_warnings():
                 # Silence warnings due to use of deprecated methods within dockerpy
@@ -652,8 +935,17 @@ class DockerContainer(Infrastructure):
         except docker.errors.DockerException as exc:
             raise RuntimeError("Could not connect to Docker.") from exc
 
+        self._client = docker_client
         return docker_client
 
+    def _get_registry_client(self):
+        # Reuse the authenticated client between calls, but log in again on every
+        # call when `reauth` is set so expiring credentials (e.g. ECR tokens) are
+        # refreshed for each run
+        if self._registry_client is None or self.image_registry.reauth:
+            self._registry_client = self.image_registry.get_docker_client()
+        return self._registry_client
+
     def _get_container_name(self) -> Optional[str]:
         """
         Generates a container name to match the configured name, ensuring it is Docker
@@ -671,7 +963,7 @@ class DockerContainer(Infrastructure):
                 # limit the length for safety
                 max_length=250,
                 # Docker allows these characters for container names
-                regex_pattern=r"[^a-zA-Z0-9_.-]+",
+                regex_pattern=CONTAINER_NAME_DISALLOWED_CHARS,
             ).lstrip(
                 # Docker does not allow leading underscore, dash, or period
                 "_-."
@@ -726,11 +1018,7 @@ class DockerContainer(Infrastructure):
             and "PREFECT_API_URL" not in self.env
             and network_mode != "host"
         ):
-            env["PREFECT_API_URL"] = (
-                env["PREFECT_API_URL"]
-                .replace("localhost", "host.docker.internal")
-                .replace("127.0.0.1", "host.docker.internal")
-            )
+            env["PREFECT_API_URL"] = _docker_internal_api_url(env["PREFECT_API_URL"])
 
         # Drop null values allowing users to "unset" variables
         return {key: value for key, value in env.items() if value is not None}
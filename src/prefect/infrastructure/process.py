@@ -1,18 +1,20 @@
 import asyncio
 import contextlib
+import logging
 import os
 import signal
 import socket
 import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
 import anyio
 import anyio.abc
 import sniffio
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from typing_extensions import Literal
 
 from prefect.exceptions import InfrastructureNotAvailable, InfrastructureNotFound
@@ -24,19 +26,30 @@ if sys.platform == "win32":
     # exit code indicating that the process was terminated by Ctrl+C or Ctrl+Break
     STATUS_CONTROL_C_EXIT = 0xC000013A
 
+_child_watcher_lock = threading.Lock()
+_child_watcher_installed = False
+
 
 def _use_threaded_child_watcher():
+    global _child_watcher_installed
     if (
         sys.version_info < (3, 8)
         and sniffio.current_async_library() == "asyncio"
         and sys.platform != "win32"
     ):
-        from prefect.utilities.compat import ThreadedChildWatcher
+        with _child_watcher_lock:
+            # Installing the watcher once is sufficient; replacing it on every run
+            # discards the previous watcher's bookkeeping thread
+            if _child_watcher_installed:
+                return
 
-        # Python < 3.8 does not use a `ThreadedChildWatcher` by default which can
-        # lead to errors in tests on unix as the previous default `SafeChildWatcher`
-        # is not compatible with threaded event loops.
-        asyncio.get_event_loop_policy().set_child_watcher(ThreadedChildWatcher())
+            from prefect.utilities.compat import ThreadedChildWatcher
+
+            # Python < 3.8 does not use a `ThreadedChildWatcher` by default which can
+            # lead to errors in tests on unix as the previous default `SafeChildWatcher`
+            # is not compatible with threaded event loops.
+            asyncio.get_event_loop_policy().set_child_watcher(ThreadedChildWatcher())
+            _child_watcher_installed = True
 
 
 def _infrastructure_pid_from_process(process: anyio.abc.Process) -> str:
@@ -89,6 +102,8 @@ class Process(Infrastructure):
         ),
     )  # Underlying accepted types are str, bytes, PathLike[str], None
 
+    _base_os_environment: Optional[Dict[str, str]] = PrivateAttr(default=None)
+
     @sync_compatible
     async def run(
         self,
@@ -108,10 +123,13 @@ class Process(Infrastructure):
             else contextlib.nullcontext(self.working_dir)
         )
         with working_dir_ctx as working_dir:
-            self.logger.debug(
-                f"Process{display_name} running command: {' '.join(self.command)} in"
-                f" {working_dir}"
-            )
+            # Guard the level so the command join is not built when debug logging
+            # is disabled
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Process{display_name} running command:"
+                    f" {' '.join(self.command)} in {working_dir}"
+                )
 
             # We must add creationflags to a dict so it is only passed as a function
             # parameter on Windows, because the presence of creationflags causes
@@ -229,7 +247,14 @@ class Process(Infrastructure):
         )
 
     def _get_environment_variables(self, include_os_environ: bool = True):
-        os_environ = os.environ if include_os_environ else {}
+        if include_os_environ:
+            # Snapshot the process environment once per instance; copying it on
+            # every submission is wasteful and it rarely changes in between
+            if self._base_os_environment is None:
+                self._base_os_environment = dict(os.environ)
+            os_environ = self._base_os_environment
+        else:
+            os_environ = {}
         # The base environment must override the current environment or
         # the Prefect settings context may not be respected
         env = {**os_environ, **self._base_environment(), **self.env}
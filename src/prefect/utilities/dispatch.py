@@ -20,6 +20,7 @@ lookup_type(Base, key) # Foo
 ```
 """
 import abc
+import functools
 import inspect
 import warnings
 from typing import Any, Dict, Optional, Type, TypeVar
@@ -29,11 +30,16 @@ T = TypeVar("T", bound=Type)
 _TYPE_REGISTRIES: Dict[Type, Dict[str, Type]] = {}
 
 
+@functools.lru_cache(maxsize=None)
 def get_registry_for_type(cls: T) -> Optional[Dict[str, T]]:
     """
     Get the first matching registry for a class or any of its base classes.
 
     If not found, `None` is returned.
+
+    The result is cached per class; walking the MRO on every dispatch lookup is
+    wasteful as registries are only added by `register_base_type`, which clears
+    the cache.
     """
     return next(
         filter(
@@ -108,6 +114,8 @@ def register_base_type(cls: T) -> T:
     base type.
     """
     registry = _TYPE_REGISTRIES.setdefault(cls, {})
+    # A new registry changes which registry existing classes resolve to
+    get_registry_for_type.cache_clear()
     base_key = get_dispatch_key(cls, allow_missing=True)
     if base_key is not None:
         registry[base_key] = cls
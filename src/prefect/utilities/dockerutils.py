@@ -1,5 +1,7 @@
+import functools
 import hashlib
 import os
+import re
 import shutil
 import sys
 import warnings
@@ -28,6 +30,11 @@ from prefect.utilities.importtools import lazy_import
 from prefect.utilities.slugify import slugify
 
 
+# Characters Docker does not allow in image tag names; precompiled so `slugify` does
+# not recompile the pattern on every call
+IMAGE_TAG_DISALLOWED_CHARS = re.compile(r"[^a-zA-Z0-9_.-]+")
+
+
 def python_version_minor() -> str:
     return f"{sys.version_info.major}.{sys.version_info.minor}"
 
@@ -36,12 +43,17 @@ def python_version_micro() -> str:
     return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
 
+@functools.lru_cache(maxsize=None)
 def get_prefect_image_name(
     prefect_version: str = None, python_version: str = None, flavor: str = None
 ) -> str:
     """
     Get the Prefect image name matching the current Prefect and Python versions.
 
+    The name only depends on the given arguments and the versions of Prefect and
+    Python in this process, so results are memoized to avoid repeating the
+    slugification on every call.
+
     Args:
         prefect_version: An optional override for the Prefect version.
         python_version: An optional override for the Python version; must be at the
@@ -63,7 +75,7 @@ def get_prefect_image_name(
         lowercase=False,
         max_length=128,
         # Docker allows these characters for tag names
-        regex_pattern=r"[^a-zA-Z0-9_.-]+",
+        regex_pattern=IMAGE_TAG_DISALLOWED_CHARS,
     )
 
     image = "prefect" if is_prod_build else "prefect-dev"
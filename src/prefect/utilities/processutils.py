@@ -49,139 +49,145 @@ if sys.platform == "win32":
         # returning 0 lets the next handler in the chain handle the signal
         return 0
 
-    # anyio process wrapper classes
-    @dataclass(eq=False)
-    class StreamReaderWrapper(anyio.abc.ByteReceiveStream):
-        _stream: asyncio.StreamReader
-
-        async def receive(self, max_bytes: int = 65536) -> bytes:
-            data = await self._stream.read(max_bytes)
-            if data:
-                return data
-            else:
-                raise anyio.EndOfStream
-
-        async def aclose(self) -> None:
-            self._stream.feed_eof()
-
-    @dataclass(eq=False)
-    class StreamWriterWrapper(anyio.abc.ByteSendStream):
-        _stream: asyncio.StreamWriter
-
-        async def send(self, item: bytes) -> None:
-            self._stream.write(item)
-            await self._stream.drain()
-
-        async def aclose(self) -> None:
-            self._stream.close()
-
-    @dataclass(eq=False)
-    class Process(anyio.abc.Process):
-        _process: asyncio.subprocess.Process
-        _stdin: Union[StreamWriterWrapper, None]
-        _stdout: Union[StreamReaderWrapper, None]
-        _stderr: Union[StreamReaderWrapper, None]
-
-        async def aclose(self) -> None:
-            if self._stdin:
-                await self._stdin.aclose()
-            if self._stdout:
-                await self._stdout.aclose()
-            if self._stderr:
-                await self._stderr.aclose()
-
-            await self.wait()
-
-        async def wait(self) -> int:
-            return await self._process.wait()
-
-        def terminate(self) -> None:
-            self._process.terminate()
-
-        def kill(self) -> None:
-            self._process.kill()
-
-        def send_signal(self, signal: int) -> None:
-            self._process.send_signal(signal)
-
-        @property
-        def pid(self) -> int:
-            return self._process.pid
-
-        @property
-        def returncode(self) -> Union[int, None]:
-            return self._process.returncode
-
-        @property
-        def stdin(self) -> Union[anyio.abc.ByteSendStream, None]:
-            return self._stdin
-
-        @property
-        def stdout(self) -> Union[anyio.abc.ByteReceiveStream, None]:
-            return self._stdout
-
-        @property
-        def stderr(self) -> Union[anyio.abc.ByteReceiveStream, None]:
-            return self._stderr
-
-    async def _open_anyio_process(
-        command: Union[str, bytes, Sequence[Union[str, bytes]]],
-        *,
-        stdin: Union[int, IO[Any], None] = None,
-        stdout: Union[int, IO[Any], None] = None,
-        stderr: Union[int, IO[Any], None] = None,
-        cwd: Union[str, bytes, os.PathLike, None] = None,
-        env: Union[Mapping[str, str], None] = None,
-        start_new_session: bool = False,
-        **kwargs,
-    ):
-        """
-        Open a subprocess and return a `Process` object.
 
-        Args:
-            command: The command to run
-            kwargs: Additional arguments to pass to `asyncio.create_subprocess_exec`
+# anyio process wrapper classes
+@dataclass(eq=False)
+class StreamReaderWrapper(anyio.abc.ByteReceiveStream):
+    _stream: asyncio.StreamReader
 
-        Returns:
-            A `Process` object
-        """
-        # call either asyncio.create_subprocess_exec or asyncio.create_subprocess_shell
-        # depending on whether the command is a list or a string
-        if isinstance(command, list):
-            process = await asyncio.create_subprocess_exec(
-                *command,
-                stdin=stdin,
-                stdout=stdout,
-                stderr=stderr,
-                cwd=cwd,
-                env=env,
-                start_new_session=start_new_session,
-                **kwargs,
-            )
+    async def receive(self, max_bytes: int = 65536) -> bytes:
+        data = await self._stream.read(max_bytes)
+        if data:
+            return data
         else:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdin=stdin,
-                stdout=stdout,
-                stderr=stderr,
-                cwd=cwd,
-                env=env,
-                start_new_session=start_new_session,
-                **kwargs,
-            )
+            raise anyio.EndOfStream
+
+    async def aclose(self) -> None:
+        self._stream.feed_eof()
+
+
+@dataclass(eq=False)
+class StreamWriterWrapper(anyio.abc.ByteSendStream):
+    _stream: asyncio.StreamWriter
+
+    async def send(self, item: bytes) -> None:
+        self._stream.write(item)
+        await self._stream.drain()
+
+    async def aclose(self) -> None:
+        self._stream.close()
+
+
+@dataclass(eq=False)
+class Process(anyio.abc.Process):
+    _process: asyncio.subprocess.Process
+    _stdin: Union[StreamWriterWrapper, None]
+    _stdout: Union[StreamReaderWrapper, None]
+    _stderr: Union[StreamReaderWrapper, None]
 
-        return Process(
-            process,
-            StreamWriterWrapper(process.stdin) if process.stdin else None,
-            StreamReaderWrapper(process.stdout) if process.stdout else None,
-            StreamReaderWrapper(process.stderr) if process.stderr else None,
+    async def aclose(self) -> None:
+        if self._stdin:
+            await self._stdin.aclose()
+        if self._stdout:
+            await self._stdout.aclose()
+        if self._stderr:
+            await self._stderr.aclose()
+
+        await self.wait()
+
+    async def wait(self) -> int:
+        return await self._process.wait()
+
+    def terminate(self) -> None:
+        self._process.terminate()
+
+    def kill(self) -> None:
+        self._process.kill()
+
+    def send_signal(self, signal: int) -> None:
+        self._process.send_signal(signal)
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    @property
+    def returncode(self) -> Union[int, None]:
+        return self._process.returncode
+
+    @property
+    def stdin(self) -> Union[anyio.abc.ByteSendStream, None]:
+        return self._stdin
+
+    @property
+    def stdout(self) -> Union[anyio.abc.ByteReceiveStream, None]:
+        return self._stdout
+
+    @property
+    def stderr(self) -> Union[anyio.abc.ByteReceiveStream, None]:
+        return self._stderr
+
+
+async def _open_anyio_process(
+    command: Union[str, bytes, Sequence[Union[str, bytes]]],
+    *,
+    stdin: Union[int, IO[Any], None] = None,
+    stdout: Union[int, IO[Any], None] = None,
+    stderr: Union[int, IO[Any], None] = None,
+    cwd: Union[str, bytes, os.PathLike, None] = None,
+    env: Union[Mapping[str, str], None] = None,
+    start_new_session: bool = False,
+    **kwargs,
+):
+    """
+    Open a subprocess and return a `Process` object.
+
+    Args:
+        command: The command to run
+        kwargs: Additional arguments to pass to `asyncio.create_subprocess_exec`
+
+    Returns:
+        A `Process` object
+    """
+    # call either asyncio.create_subprocess_exec or asyncio.create_subprocess_shell
+    # depending on whether the command is a list or a string
+    if isinstance(command, list):
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            cwd=cwd,
+            env=env,
+            start_new_session=start_new_session,
+            **kwargs,
+        )
+    else:
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            cwd=cwd,
+            env=env,
+            start_new_session=start_new_session,
+            **kwargs,
         )
 
+    return Process(
+        process,
+        StreamWriterWrapper(process.stdin) if process.stdin else None,
+        StreamReaderWrapper(process.stdout) if process.stdout else None,
+        StreamReaderWrapper(process.stderr) if process.stderr else None,
+    )
+
 
 @asynccontextmanager
 async def open_process(command: List[str], **kwargs):
     """
     Like `anyio.open_process` but with:
+    - Use of `asyncio.create_subprocess_exec` directly, avoiding the extra
+      task-group overhead of `anyio.open_process`
     - Support for Windows command joining
     - Termination of the process on exception during yield
     - Forced cleanup of process resources during cancellation
@@ -197,9 +203,8 @@ async def open_process(command: List[str], **kwargs):
 
     if sys.platform == "win32":
         command = " ".join(command)
-        process = await _open_anyio_process(command, **kwargs)
-    else:
-        process = await anyio.open_process(command, **kwargs)
+
+    process = await _open_anyio_process(command, **kwargs)
 
     # if there's a creationflags kwarg and it contains CREATE_NEW_PROCESS_GROUP,
     # use SetConsoleCtrlHandler to handle CTRL-C
@@ -285,16 +290,50 @@ async def consume_process_output(
     stderr_sink: Optional[TextSink] = None,
 ):
     async with anyio.create_task_group() as tg:
-        tg.start_soon(
-            stream_text,
-            TextReceiveStream(process.stdout),
-            stdout_sink,
-        )
-        tg.start_soon(
-            stream_text,
-            TextReceiveStream(process.stderr),
-            stderr_sink,
-        )
+        for source, sink in (
+            (process.stdout, stdout_sink),
+            (process.stderr, stderr_sink),
+        ):
+            if sink is None or _get_buffer(sink) is not None:
+                # Dropped output and file-like sinks backed by a binary buffer
+                # can consume raw bytes, skipping the decode and per-fragment
+                # string allocations of `TextReceiveStream`
+                tg.start_soon(stream_bytes, source, sink)
+            else:
+                tg.start_soon(stream_text, TextReceiveStream(source), sink)
+
+
+def _get_buffer(sink: TextSink) -> Optional[IO[bytes]]:
+    """
+    Get the underlying binary buffer for a text-mode file sink, if it has one.
+    """
+    if isinstance(sink, TextIOBase):
+        return getattr(sink, "buffer", None)
+    return None
+
+
+async def stream_bytes(
+    source: anyio.abc.ByteReceiveStream,
+    sink: Optional[TextIOBase],
+    chunk_size: int = 65536,
+):
+    """
+    Stream chunks of bytes from a byte stream directly to the binary buffer of a
+    text-mode file sink, or consume and drop them if the sink is null.
+    """
+    buffer = _get_buffer(sink) if sink is not None else None
+    if buffer is not None:
+        # Push any pending text writes so output is not reordered around them
+        sink.flush()
+
+    try:
+        while True:
+            chunk = await source.receive(chunk_size)
+            if buffer is not None:
+                buffer.write(chunk)
+                buffer.flush()
+    except anyio.EndOfStream:
+        pass
 
 
 async def stream_text(source: TextReceiveStream, sink: Optional[TextSink]):
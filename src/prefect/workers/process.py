@@ -25,6 +25,7 @@ import socket
 import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
@@ -52,19 +53,30 @@ if sys.platform == "win32":
     # exit code indicating that the process was terminated by Ctrl+C or Ctrl+Break
     STATUS_CONTROL_C_EXIT = 0xC000013A
 
+_child_watcher_lock = threading.Lock()
+_child_watcher_installed = False
+
 
 def _use_threaded_child_watcher():
+    global _child_watcher_installed
     if (
         sys.version_info < (3, 8)
         and sniffio.current_async_library() == "asyncio"
         and sys.platform != "win32"
     ):
-        from prefect.utilities.compat import ThreadedChildWatcher
+        with _child_watcher_lock:
+            # Installing the watcher once is sufficient; replacing it on every run
+            # discards the previous watcher's bookkeeping thread
+            if _child_watcher_installed:
+                return
+
+            from prefect.utilities.compat import ThreadedChildWatcher
 
-        # Python < 3.8 does not use a `ThreadedChildWatcher` by default which can
-        # lead to errors in tests on unix as the previous default `SafeChildWatcher`
-        # is not compatible with threaded event loops.
-        asyncio.get_event_loop_policy().set_child_watcher(ThreadedChildWatcher())
+            # Python < 3.8 does not use a `ThreadedChildWatcher` by default which can
+            # lead to errors in tests on unix as the previous default `SafeChildWatcher`
+            # is not compatible with threaded event loops.
+            asyncio.get_event_loop_policy().set_child_watcher(ThreadedChildWatcher())
+            _child_watcher_installed = True
 
 
 def _infrastructure_pid_from_process(process: anyio.abc.Process) -> str:
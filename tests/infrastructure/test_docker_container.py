@@ -1,4 +1,5 @@
 import re
+import threading
 import uuid
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
@@ -13,6 +14,7 @@ from prefect.infrastructure.container import (
     DockerContainer,
     DockerRegistry,
     ImagePullPolicy,
+    _ContainerEventMonitor,
 )
 from prefect.testing.utilities import assert_does_not_warn
 from prefect.utilities.dockerutils import get_prefect_image_name
@@ -725,6 +727,33 @@ def test_task_status_receives_result_identifier(mock_docker_client):
     fake_status.started.assert_called_once_with(result.identifier)
 
 
+def test_start_failure_reported_as_crashed_after_started(mock_docker_client):
+    # Errors that only surface on `start` must not raise once the task status has
+    # been reported as started or the flow run would be left pending forever
+    fake_container = mock_docker_client.containers.create.return_value
+    fake_container.start = MagicMock(
+        side_effect=docker.errors.APIError("executable file not found")
+    )
+
+    fake_status = MagicMock(spec=anyio.abc.TaskStatus)
+    result = DockerContainer(command=["echo", "hello"], stream_output=False).run(
+        task_status=fake_status
+    )
+
+    fake_status.started.assert_called_once()
+    assert result.status_code == -1
+
+
+def test_start_failure_raises_without_task_status(mock_docker_client):
+    fake_container = mock_docker_client.containers.create.return_value
+    fake_container.start = MagicMock(
+        side_effect=docker.errors.APIError("executable file not found")
+    )
+
+    with pytest.raises(docker.errors.APIError):
+        DockerContainer(command=["echo", "hello"], stream_output=False).run()
+
+
 @pytest.mark.usefixtures("use_hosted_api_server")
 @pytest.mark.parametrize("platform", ["win32", "darwin"])
 def test_does_not_warn_about_gateway_if_not_using_linux(
@@ -837,6 +866,33 @@ def test_stream_container_logs(capsys, mock_docker_client):
     assert "hello\nworld\n" in captured.out
 
 
+def test_stream_container_logs_releases_fetcher_on_write_error(
+    monkeypatch, mock_docker_client
+):
+    # A failed write must not leave the fetcher thread blocked on the full
+    # queue, pinning the log stream connection
+    mock_container = mock_docker_client.containers.get.return_value
+    mock_container.logs = MagicMock(return_value=iter([b"hello"] * 1000))
+
+    fake_stdout = MagicMock()
+    fake_stdout.buffer.write.side_effect = BrokenPipeError
+    monkeypatch.setattr("prefect.infrastructure.container.sys.stdout", fake_stdout)
+
+    with pytest.raises(BrokenPipeError):
+        DockerContainer(command=["doesnt", "matter"])._stream_container_logs(
+            mock_container
+        )
+
+    fetchers = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("docker-logs-")
+    ]
+    for fetcher in fetchers:
+        fetcher.join(timeout=5)
+    assert not any(fetcher.is_alive() for fetcher in fetchers)
+
+
 def test_logs_warning_when_container_marked_for_removal(caplog, mock_docker_client):
     warning = (
         "Docker container fake-name was marked for removal before logs "
@@ -876,3 +932,69 @@ def test_stream_container_logs_on_real_container(capsys):
 
     captured = capsys.readouterr()
     assert "hello" in captured.out
+
+
+class FakeEventMonitorContainer:
+    """A stand-in for a docker `Container` that reports queued statuses."""
+
+    def __init__(self, id: str, statuses: list):
+        self.id = id
+        self.status = None
+        self._statuses = iter(statuses)
+
+    def reload(self):
+        self.status = next(self._statuses)
+
+
+def test_event_monitor_wakes_waiter_on_die_event(monkeypatch):
+    stop_stream = threading.Event()
+
+    def event_stream():
+        yield {"id": "fake-id", "status": "die"}
+        # Keep the stream open like a live connection to the daemon
+        stop_stream.wait()
+
+    client = MagicMock()
+    client.events.return_value = event_stream()
+    monkeypatch.setattr("docker.from_env", MagicMock(return_value=client))
+
+    container = FakeEventMonitorContainer("fake-id", ["running", "exited"])
+    monitor = _ContainerEventMonitor()
+    try:
+        assert monitor.wait_for_exit(container, liveness_interval=0.1) is True
+    finally:
+        stop_stream.set()
+
+
+def test_event_monitor_detects_exit_before_subscription(monkeypatch):
+    stop_stream = threading.Event()
+
+    def event_stream():
+        # The container exited before the subscription was active so its `die`
+        # event is never delivered
+        stop_stream.wait()
+        return
+        yield
+
+    client = MagicMock()
+    client.events.return_value = event_stream()
+    monkeypatch.setattr("docker.from_env", MagicMock(return_value=client))
+
+    container = FakeEventMonitorContainer("fake-id", ["exited"])
+    monitor = _ContainerEventMonitor()
+    try:
+        assert monitor.wait_for_exit(container, liveness_interval=0.1) is True
+    finally:
+        stop_stream.set()
+
+
+def test_event_monitor_reports_failure_when_stream_raises(monkeypatch):
+    client = MagicMock()
+    client.events.side_effect = docker.errors.APIError("Connection aborted")
+    monkeypatch.setattr("docker.from_env", MagicMock(return_value=client))
+
+    container = FakeEventMonitorContainer("fake-id", ["running", "running"])
+    monitor = _ContainerEventMonitor()
+
+    # The caller should fall back to `Container.wait()`
+    assert monitor.wait_for_exit(container, liveness_interval=0.1) is False